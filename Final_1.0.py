@@ -1,11 +1,41 @@
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import itertools
+import os
+import re
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import pyarrow as pa
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 
 class DataManager:
-    def __init__(self, tabdb_path, playdb_path, requestdb_path):
+    # Columns read from tabdb.csv and the dtype each one is parsed as
+    # Low-cardinality columns are categoricals, so filters and value_counts work on integer codes
+    TABDB_DTYPES = {
+        "song": "string[pyarrow]",
+        "artist": "category",
+        "year": "Int32",
+        "type": "category",
+        "gender": "category",
+        "duration": "float64",
+        "language": "category",
+        "tabber": "category",
+        "source": "category",
+        "date": "string[pyarrow]",
+        "difficulty": "Int16",
+        "special books": "string[pyarrow]",
+    }
+    PLAYDB_DTYPES = {"song": "string[pyarrow]", "artist": "string[pyarrow]"}
+    REQUESTDB_DTYPES = {"song": "string[pyarrow]", "artist": "string[pyarrow]"}
+    # Bump whenever _validate_* changes what a loaded DataFrame looks like, so old cache files are ignored
+    CACHE_VERSION = 1
+
+    def __init__(self, tabdb_path, playdb_path, requestdb_path, chunksize=None):
         """
         Initializes the DataManager with paths to the CSV files.
         
@@ -13,14 +43,27 @@ class DataManager:
             tabdb_path (str): Path to the tabdb CSV file.
             playdb_path (str): Path to the playdb CSV file.
             requestdb_path (str): Path to the requestdb CSV file.
+            chunksize (int, optional): If given, the CSV files are read this many rows at a time
+                to keep peak memory low while loading.
         """
         self.tabdb_path = tabdb_path
         self.playdb_path = playdb_path
         self.requestdb_path = requestdb_path
+        self.chunksize = chunksize
         
         self.tabdb = None
         self.playdb = None
         self.requestdb = None
+        
+        # Row positions keyed by song/artist, used by QueryManager instead of full scans
+        self._tabdb_by_artist = {}
+        self._tabdb_by_song = {}
+        self._playdb_by_song = {}
+        self._requestdb_by_artist = {}
+        
+        # Tuesday date columns of playdb and a songs x dates matrix of 1 (played) / 0 (not played)
+        self._play_dates = pd.Index([])
+        self._play_matrix = np.zeros((0, 0), dtype=np.uint8)
     
     def load_data(self):
         """
@@ -28,19 +71,53 @@ class DataManager:
         Performs basic validation to ensure the data is correct.
         """
         try:
+            # Read the three files in parallel (the CSV and Feather readers release the GIL while parsing),
+            # then validate them one by one on the main thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                tabdb_future = executor.submit(
+                    self._read_csv,
+                    self.tabdb_path,
+                    usecols=TABDB_REQUIRED,
+                    dtype=self.TABDB_DTYPES,
+                    keep_default_na=False,
+                    na_values=[""],
+                )
+                playdb_future = executor.submit(
+                    self._read_csv, self.playdb_path, dtype=self.PLAYDB_DTYPES, keep_default_na=False
+                )
+                requestdb_future = executor.submit(
+                    self._read_csv, self.requestdb_path, dtype=self.REQUESTDB_DTYPES, keep_default_na=False
+                )
+            
+            # Each frame replaces the current one, and its indexes are rebuilt, only once it has passed
+            # validation; a file that fails keeps the previous data and indexes consistent with each other
             # Load tabdb.csv
-            self.tabdb = pd.read_csv(self.tabdb_path)
-            self._validate_tabdb()
+            tabdb, cached, cache_path = tabdb_future.result()
+            if not cached:
+                tabdb = self._validate_tabdb(tabdb)
+                self._write_cache(self.tabdb_path, cache_path, tabdb)
+            self.tabdb = tabdb
+            self._tabdb_by_artist = self._build_index(self.tabdb, "artist")
+            self._tabdb_by_song = self._build_index(self.tabdb, "song")
             print("tabdb.csv loaded successfully.")
             
             # Load playdb.csv
-            self.playdb = pd.read_csv(self.playdb_path)
-            self._validate_playdb()
+            playdb, cached, cache_path = playdb_future.result()
+            if not cached:
+                playdb = self._validate_playdb(playdb)
+                self._write_cache(self.playdb_path, cache_path, playdb)
+            self.playdb = playdb
+            self._playdb_by_song = self._build_index(self.playdb, "song")
+            self._play_dates, self._play_matrix = self._build_play_matrix(self.playdb)
             print("playdb.csv loaded successfully.")
             
             # Load requestdb.csv
-            self.requestdb = pd.read_csv(self.requestdb_path)
-            self._validate_requestdb()
+            requestdb, cached, cache_path = requestdb_future.result()
+            if not cached:
+                requestdb = self._validate_requestdb(requestdb)
+                self._write_cache(self.requestdb_path, cache_path, requestdb)
+            self.requestdb = requestdb
+            self._requestdb_by_artist = self._build_index(self.requestdb, "artist")
             print("requestdb.csv loaded successfully.")
             
         except FileNotFoundError as e:
@@ -50,53 +127,243 @@ class DataManager:
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
-    def _validate_tabdb(self):
+    @classmethod
+    def _cache_schema(cls):
         """
-        Validates the tabdb DataFrame to ensure it contains the required columns and correct data types.
+        Returns a short hash of the cache version and the column schema, used in cache file names.
+        
+        Returns:
+            str: Eight hex digits identifying the current loading pipeline.
+        """
+        schema = (
+            cls.CACHE_VERSION,
+            sorted(cls.TABDB_DTYPES.items()),
+            sorted(cls.PLAYDB_DTYPES.items()),
+            sorted(cls.REQUESTDB_DTYPES.items()),
+            sorted(TABDB_REQUIRED),
+            sorted(PLAYDB_REQUIRED),
+            sorted(REQUESTDB_REQUIRED),
+        )
+        return hashlib.sha1(repr(schema).encode()).hexdigest()[:8]
+
+    @classmethod
+    def _cache_path(cls, path):
         """
-        required_columns = ["song", "artist", "year", "type", "gender", "duration", "language", "tabber", "source", "date", "difficulty", "special books"]
+        Returns the cache file for a CSV file. The name includes the CSV's modification time and size
+        and the schema hash, so editing the CSV or the loading code makes the old cache file unused.
+        
+        Args:
+            path (str): Path to the CSV file.
+        
+        Returns:
+            str: Path to the Feather file in a .cache directory next to the CSV.
+        """
+        stat = os.stat(path)
+        name = os.path.splitext(os.path.basename(path))[0]
+        file_name = f"{name}_{cls._cache_schema()}_{stat.st_mtime_ns}_{stat.st_size}.feather"
+        return os.path.join(os.path.dirname(path), ".cache", file_name)
+
+    def _read_csv(self, path, usecols=None, **kwargs):
+        """
+        Reads a CSV file with the pyarrow engine, or its already validated copy from the cache
+        if the CSV has not changed since that copy was written.
+        
+        Args:
+            path (str): Path to the CSV file.
+            usecols (set, optional): Columns to keep. Columns missing from the file are skipped
+                so that validation can report them.
+            **kwargs: Extra keyword arguments passed to pd.read_csv.
+        
+        Returns:
+            tuple: The loaded DataFrame, True if it came from the cache and needs no validation,
+                and the cache file for this version of the CSV.
+        """
+        # Take the cache key before reading, so a CSV saved while it is being parsed gets a new key
+        cache_path = self._cache_path(path)
+        if os.path.exists(cache_path):
+            try:
+                return pd.read_feather(cache_path), True, cache_path
+            except (OSError, pa.ArrowInvalid) as e:
+                # A damaged cache file would fail every load; drop it and parse the CSV instead
+                print(f"Warning: ignoring unreadable cache file {cache_path}: {e}")
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+        
+        if usecols is not None:
+            # The pyarrow engine fails on unknown columns, so only ask for the ones in the header
+            header = pd.read_csv(path, nrows=0).columns
+            usecols = [column for column in header if column in usecols]
+        
+        if self.chunksize:
+            df = self._read_csv_chunked(path, usecols=usecols, **kwargs)
+        else:
+            try:
+                df = pd.read_csv(path, usecols=usecols, engine="pyarrow", **kwargs)
+            except pd.errors.ParserError as e:
+                # The pyarrow engine reports an empty file as a parser error; raise it the way the C engine does
+                if "Empty CSV file" in str(e):
+                    raise pd.errors.EmptyDataError(f"No columns to parse from file: {path}") from e
+                raise
+        return df, False, cache_path
+
+    def _write_cache(self, path, cache_path, df):
+        """
+        Saves a validated DataFrame to the cache so later loads can skip parsing and validating the CSV.
+        Cache files and temporary files left over from older versions of the CSV are removed.
+        
+        Args:
+            path (str): Path to the CSV file the DataFrame was loaded from.
+            cache_path (str): The cache file returned by _read_csv when the CSV was read.
+            df (DataFrame): The validated DataFrame.
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Only remove files named exactly <name>[_<schema>]_<mtime>_<size>, not caches of other CSVs sharing
+            # the prefix, along with temporary files left behind by interrupted writes
+            old_cache = re.compile(rf"^{re.escape(name)}_(?:[0-9a-f]+_)?\d+_\d+\.feather(?:\.\d+\.tmp)?$")
+            cache_dir = os.path.dirname(cache_path)
+            for file_name in os.listdir(cache_dir):
+                if old_cache.match(file_name):
+                    os.remove(os.path.join(cache_dir, file_name))
+            # Write to a temporary file first so an interrupted write never leaves a partial cache file behind
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                df.reset_index(drop=True).to_feather(tmp_path, compression="zstd")
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: could not write cache file {cache_path}: {e}")
+
+    def _read_csv_chunked(self, path, dtype=None, **kwargs):
+        """
+        Reads a CSV file in chunks of self.chunksize rows and joins them into one DataFrame.
+        The pyarrow engine has no chunked mode, so this uses the C engine.
+        
+        Args:
+            path (str): Path to the CSV file.
+            dtype (dict, optional): Column dtypes, as for pd.read_csv.
+            **kwargs: Extra keyword arguments passed to pd.read_csv.
+        
+        Returns:
+            DataFrame: The loaded data.
+        """
+        # Chunks infer types (and categories) independently, so read every column that would
+        # be inferred or categorical as text and convert the categoricals once at the end
+        dtype = collections.defaultdict(lambda: "string[pyarrow]", dtype or {})
+        categorical = [column for column, column_dtype in dtype.items() if column_dtype == "category"]
+        dtype.update({column: "string[pyarrow]" for column in categorical})
+        
+        chunks = pd.read_csv(path, dtype=dtype, chunksize=self.chunksize, engine="c", **kwargs)
+        df = pd.concat(chunks, ignore_index=True)
+        return df.astype({column: "category" for column in categorical if column in df.columns})
+
+    @staticmethod
+    def _build_index(df, column):
+        """
+        Maps each value of a column to the positions of the rows that hold it.
+        
+        Args:
+            df (DataFrame): The DataFrame to index.
+            column (str): The column to index by.
+        
+        Returns:
+            dict: A dictionary of value -> array of row positions.
+        """
+        return df.groupby(column, sort=False, observed=True).indices
+
+    @staticmethod
+    def _build_play_matrix(playdb):
+        """
+        Marks which songs were played on which Tuesday. A cell counts as played when it is not empty.
+        
+        Args:
+            playdb (DataFrame): The validated playdb DataFrame.
+        
+        Returns:
+            tuple: The Tuesday date columns and a uint8 array with one row per song and one column per date.
+        """
+        plays = playdb.drop(columns=["song", "artist"])
+        played = plays.notna() & plays.ne("")
+        return plays.columns, played.to_numpy(dtype=np.uint8)
+
+    def _validate_tabdb(self, tabdb):
+        """
+        Validates the tabdb DataFrame to ensure it contains the required columns and correct data types.
+        
+        Args:
+            tabdb (DataFrame): The tabdb DataFrame as read from the CSV file.
         
+        Returns:
+            DataFrame: The validated DataFrame, with parsed dates, sorted by date.
+        """
         # Check if all required columns are present
-        for column in required_columns:
-            if column not in self.tabdb.columns:
-                raise ValueError(f"Missing required column in tabdb.csv: {column}")
+        missing = TABDB_REQUIRED.difference(tabdb.columns)
+        if missing:
+            raise ValueError(f"Missing required columns in tabdb.csv: {', '.join(sorted(missing))}")
         
         # Validate data types
-        if not np.issubdtype(self.tabdb["year"].dtype, np.number):
+        if not pd.api.types.is_numeric_dtype(tabdb["year"]):
             raise ValueError("Column 'year' must be numeric in tabdb.csv.")
-        if not np.issubdtype(self.tabdb["difficulty"].dtype, np.number):
+        if not pd.api.types.is_numeric_dtype(tabdb["difficulty"]):
             raise ValueError("Column 'difficulty' must be numeric in tabdb.csv.")
         
-        # Handle missing values
-        self.tabdb.fillna("Unknown", inplace=True)
+        # Parse dates once and keep the rows sorted by date so date filters can binary search
+        tabdb["date"] = pd.to_datetime(tabdb["date"], errors="coerce", format="%Y-%m-%d", cache=True)
+        tabdb.sort_values("date", inplace=True, kind="mergesort")
+        tabdb.reset_index(drop=True, inplace=True)
+        
+        # Handle missing values in the text columns only; numeric columns keep their own missing values
+        for column in tabdb.select_dtypes(include=["string", "category"]).columns:
+            values = tabdb[column]
+            if not values.hasnans:
+                continue
+            if isinstance(values.dtype, pd.CategoricalDtype) and "Unknown" not in values.cat.categories:
+                values = values.cat.add_categories("Unknown")
+            tabdb[column] = values.fillna("Unknown")
+        return tabdb
 
-    def _validate_playdb(self):
+    def _validate_playdb(self, playdb):
         """
         Validates the playdb DataFrame to ensure it contains the required columns.
-        """
-        required_columns = ["song", "artist"]
         
-        # Check if all required columns are present
-        for column in required_columns:
-            if column not in self.playdb.columns:
-                raise ValueError(f"Missing required column in playdb.csv: {column}")
+        Args:
+            playdb (DataFrame): The playdb DataFrame as read from the CSV file.
         
-        # Handle missing values
-        self.playdb.fillna("", inplace=True)
+        Returns:
+            DataFrame: The validated DataFrame.
+        """
+        # Check if all required columns are present
+        missing = PLAYDB_REQUIRED.difference(playdb.columns)
+        if missing:
+            raise ValueError(f"Missing required columns in playdb.csv: {', '.join(sorted(missing))}")
+        return playdb
 
-    def _validate_requestdb(self):
+    def _validate_requestdb(self, requestdb):
         """
         Validates the requestdb DataFrame to ensure it contains the required columns.
-        """
-        required_columns = ["song", "artist"]
         
-        # Check if all required columns are present
-        for column in required_columns:
-            if column not in self.requestdb.columns:
-                raise ValueError(f"Missing required column in requestdb.csv: {column}")
+        Args:
+            requestdb (DataFrame): The requestdb DataFrame as read from the CSV file.
         
-        # Handle missing values
-        self.requestdb.fillna("", inplace=True)
+        Returns:
+            DataFrame: The validated DataFrame.
+        """
+        # Check if all required columns are present
+        missing = REQUESTDB_REQUIRED.difference(requestdb.columns)
+        if missing:
+            raise ValueError(f"Missing required columns in requestdb.csv: {', '.join(sorted(missing))}")
+        return requestdb
+
+# Columns each CSV file must contain, taken from the dtype maps so the two can't drift apart
+TABDB_REQUIRED = frozenset(DataManager.TABDB_DTYPES)
+PLAYDB_REQUIRED = frozenset(DataManager.PLAYDB_DTYPES)
+REQUESTDB_REQUIRED = frozenset(DataManager.REQUESTDB_DTYPES)
 
 class QueryManager:
     def __init__(self, data_manager):
@@ -122,13 +389,26 @@ class QueryManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        for column, value in filters.items():
-            if column in df.columns:
-                df = df[df[column] == value]
-            else:
+        for column in filters:
+            if column not in df.columns:
                 raise ValueError(f"Column '{column}' does not exist in tabdb.")
         
-        return df
+        # Artist and song filters are answered from the row indexes instead of comparing every row
+        filters = dict(filters)
+        rows = None
+        for column, index in (("artist", self.data_manager._tabdb_by_artist), ("song", self.data_manager._tabdb_by_song)):
+            if column in filters:
+                matches = index.get(filters.pop(column), np.array([], dtype=np.intp))
+                rows = matches if rows is None else np.intersect1d(rows, matches)
+        if rows is not None:
+            df = df.take(rows)
+        
+        # Combine the remaining filters into one mask so the DataFrame is only sliced once
+        mask = np.ones(len(df), dtype=bool)
+        for column, value in filters.items():
+            mask &= df[column].eq(value).to_numpy(dtype=bool, na_value=False)
+        
+        return df.loc[mask]
     
     def filter_by_date_range(self, start_date, end_date):
         """
@@ -145,9 +425,11 @@ class QueryManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        mask = (df['date'] >= start_date) & (df['date'] <= end_date)
-        return df.loc[mask]
+        # tabdb is sorted by date on load, so the matching rows form one contiguous slice
+        dates = df['date'].to_numpy()
+        start = dates.searchsorted(np.datetime64(start_date), side='left')
+        end = dates.searchsorted(np.datetime64(end_date), side='right')
+        return df.iloc[start:end]
     
     def filter_playdb_by_song(self, song_title):
         """
@@ -163,7 +445,8 @@ class QueryManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        return df[df['song'] == song_title]
+        rows = self.data_manager._playdb_by_song.get(song_title)
+        return df.take(rows) if rows is not None else df.iloc[:0]
     
     def filter_requestdb_by_artist(self, artist_name):
         """
@@ -179,7 +462,8 @@ class QueryManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        return df[df['artist'] == artist_name]
+        rows = self.data_manager._requestdb_by_artist.get(artist_name)
+        return df.take(rows) if rows is not None else df.iloc[:0]
 
     def count_song_plays(self, song_title):
         """
@@ -195,7 +479,10 @@ class QueryManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        return df[song_title].count()
+        rows = self.data_manager._playdb_by_song.get(song_title)
+        if rows is None:
+            return 0
+        return int(self.data_manager._play_matrix[rows].sum())
 
 class PlotManager:
     def __init__(self, data_manager):
@@ -206,6 +493,59 @@ class PlotManager:
             data_manager (DataManager): An instance of DataManager containing the loaded data.
         """
         self.data_manager = data_manager
+        self._vc_cache = {}
+        
+        # A single figure is reused for every plot; the UserInterface embeds it in its window
+        self.figure = Figure(figsize=(8, 5))
+        self._ax = self.figure.add_subplot()
+        self._current_plot = None
+    
+    def on_data_reloaded(self):
+        """
+        Clears the cached plot data after the DataManager has reloaded its files.
+        """
+        self._vc_cache.clear()
+        self._current_plot = None
+    
+    def _new_plot(self, name):
+        """
+        Clears the shared axes so a new plot can be drawn on them.
+        
+        Args:
+            name (str): A name identifying the plot about to be drawn.
+        
+        Returns:
+            bool: False if this plot is already on display for the current data, so drawing it again can be skipped.
+        """
+        if self._current_plot == name:
+            return False
+        # The plot method records its name only after drawing succeeds, so a failed plot is retried next time
+        self._ax.cla()
+        self._current_plot = None
+        return True
+    
+    def _value_counts(self, column):
+        """
+        Returns the value counts of a tabdb column, computing them only once per load.
+        
+        Args:
+            column (str): The tabdb column to count.
+        
+        Returns:
+            Series: The number of songs for each value of the column.
+        """
+        if column not in self._vc_cache:
+            values = self.data_manager.tabdb[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Count the integer category codes directly; missing values have code -1
+                codes = values.cat.codes.to_numpy()
+                counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+                value_counts = pd.Series(counts, index=values.cat.categories.rename(column), name="count")
+                value_counts = value_counts[value_counts > 0].sort_values(ascending=False, kind="stable")
+            else:
+                value_counts = values.value_counts()
+            self._vc_cache[column] = value_counts
+        return self._vc_cache[column]
     
     def plot_difficulty_histogram(self):
         """
@@ -215,10 +555,16 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['difficulty'].plot(kind='hist', bins=5, edgecolor='black', title='Histogram of Songs by Difficulty Level')
-        plt.xlabel('Difficulty Level')
-        plt.ylabel('Frequency')
-        plt.show()
+        if not self._new_plot('difficulty'):
+            return
+        
+        values = df['difficulty'].to_numpy(dtype=np.float32, na_value=np.nan)
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=5)
+        self._ax.bar((edges[:-1] + edges[1:]) / 2, counts, width=np.diff(edges), edgecolor='black')
+        self._ax.set_title('Histogram of Songs by Difficulty Level')
+        self._ax.set_xlabel('Difficulty Level')
+        self._ax.set_ylabel('Frequency')
+        self._current_plot = 'difficulty'
     
     def plot_duration_histogram(self):
         """
@@ -228,10 +574,16 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['duration'].plot(kind='hist', bins=10, edgecolor='black', title='Histogram of Songs by Duration')
-        plt.xlabel('Duration (minutes)')
-        plt.ylabel('Frequency')
-        plt.show()
+        if not self._new_plot('duration'):
+            return
+        
+        values = df['duration'].to_numpy(dtype=np.float32, na_value=np.nan)
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=10)
+        self._ax.bar((edges[:-1] + edges[1:]) / 2, counts, width=np.diff(edges), edgecolor='black')
+        self._ax.set_title('Histogram of Songs by Duration')
+        self._ax.set_xlabel('Duration (minutes)')
+        self._ax.set_ylabel('Frequency')
+        self._current_plot = 'duration'
     
     def plot_language_bar_chart(self):
         """
@@ -241,10 +593,13 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['language'].value_counts().plot(kind='bar', title='Bar Chart of Songs by Language')
-        plt.xlabel('Language')
-        plt.ylabel('Number of Songs')
-        plt.show()
+        if not self._new_plot('language'):
+            return
+        
+        self._value_counts('language').plot(ax=self._ax, kind='bar', title='Bar Chart of Songs by Language')
+        self._ax.set_xlabel('Language')
+        self._ax.set_ylabel('Number of Songs')
+        self._current_plot = 'language'
     
     def plot_source_bar_chart(self):
         """
@@ -254,10 +609,13 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['source'].value_counts().plot(kind='bar', title='Bar Chart of Songs by Source')
-        plt.xlabel('Source')
-        plt.ylabel('Number of Songs')
-        plt.show()
+        if not self._new_plot('source'):
+            return
+        
+        self._value_counts('source').plot(ax=self._ax, kind='bar', title='Bar Chart of Songs by Source')
+        self._ax.set_xlabel('Source')
+        self._ax.set_ylabel('Number of Songs')
+        self._current_plot = 'source'
     
     def plot_bar_chart_by_decade(self):
         """
@@ -267,12 +625,17 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['year'] = pd.to_numeric(df['year'], errors='coerce')
-        df['decade'] = (df['year'] // 10) * 10
-        df['decade'].value_counts().sort_index().plot(kind='bar', title='Bar Chart of Songs by Decade')
-        plt.xlabel('Decade')
-        plt.ylabel('Number of Songs')
-        plt.show()
+        if not self._new_plot('decade'):
+            return
+        
+        # year is already numeric after validation; bin it locally instead of adding a column to tabdb
+        years = df['year'].to_numpy(dtype=np.float64, na_value=np.nan)
+        years = years[~np.isnan(years)].astype(np.int64)
+        decades = (years // 10) * 10
+        pd.Series(decades).value_counts().sort_index().plot(ax=self._ax, kind='bar', title='Bar Chart of Songs by Decade')
+        self._ax.set_xlabel('Decade')
+        self._ax.set_ylabel('Number of Songs')
+        self._current_plot = 'decade'
     
     def plot_cumulative_line_chart(self):
         """
@@ -282,11 +645,15 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        cumulative_play_count = df.drop(columns=['song', 'artist']).count(axis=0).cumsum()
-        cumulative_play_count.plot(kind='line', title='Cumulative Line Chart of Songs Played Each Tuesday')
-        plt.xlabel('Date')
-        plt.ylabel('Cumulative Songs Played')
-        plt.show()
+        if not self._new_plot('cumulative'):
+            return
+        
+        play_counts = self.data_manager._play_matrix.sum(axis=0, dtype=np.int64)
+        cumulative_play_count = pd.Series(play_counts.cumsum(), index=self.data_manager._play_dates)
+        cumulative_play_count.plot(ax=self._ax, kind='line', title='Cumulative Line Chart of Songs Played Each Tuesday')
+        self._ax.set_xlabel('Date')
+        self._ax.set_ylabel('Cumulative Songs Played')
+        self._current_plot = 'cumulative'
     
     def plot_pie_chart_by_gender(self):
         """
@@ -296,11 +663,17 @@ class PlotManager:
         if df is None:
             raise ValueError("Data has not been loaded. Please load the data using DataManager first.")
         
-        df['gender'].value_counts().plot(kind='pie', autopct='%1.1f%%', title='Pie Chart of Songs by Gender')
-        plt.ylabel('')
-        plt.show()
+        if not self._new_plot('gender'):
+            return
+        
+        self._value_counts('gender').plot(ax=self._ax, kind='pie', autopct='%1.1f%%', title='Pie Chart of Songs by Gender')
+        self._ax.set_ylabel('')
+        self._current_plot = 'gender'
 
 class UserInterface:
+    # Number of rows added to the results table per "Load more" click
+    PAGE_SIZE = 1000
+
     def __init__(self, data_manager, query_manager, plot_manager):
         """
         Initializes the UserInterface with references to DataManager, QueryManager, and PlotManager.
@@ -317,6 +690,11 @@ class UserInterface:
         self.root.title("Ukulele Tuesday Data Analysis")
         
         self.create_widgets()
+    
+    def run(self):
+        """
+        Start the Tk main loop. Blocks until the window is closed.
+        """
         self.root.mainloop()
     
     def create_widgets(self):
@@ -331,6 +709,10 @@ class UserInterface:
         
         plot_button = tk.Button(self.root, text="Plot Data", command=self.plot_data)
         plot_button.pack(pady=5)
+        
+        # Plots are drawn into the PlotManager's figure, shown here instead of in a separate window
+        self.canvas = FigureCanvasTkAgg(self.plot_manager.figure, master=self.root)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
     def load_data(self):
         """
@@ -338,6 +720,7 @@ class UserInterface:
         """
         try:
             self.data_manager.load_data()
+            self.plot_manager.on_data_reloaded()
             messagebox.showinfo("Info", "Data loaded successfully.")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -386,6 +769,8 @@ class UserInterface:
                 self.plot_manager.plot_pie_chart_by_gender()
             else:
                 messagebox.showwarning("Warning", "Invalid plot type selected.")
+                return
+            self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror("Error", str(e))
     
@@ -409,13 +794,33 @@ class UserInterface:
                 tree.heading(column, text=column)
                 tree.column(column, anchor="w")
             
-            for _, row in df.iterrows():
-                tree.insert("", "end", values=list(row))
+            # Insert plain tuples a page at a time; the Treeview slows down with every row it holds
+            rows = df.itertuples(index=False, name=None)
+            inserted = 0
+            
+            def load_more():
+                nonlocal inserted
+                for row in itertools.islice(rows, self.PAGE_SIZE):
+                    tree.insert("", "end", values=row)
+                    inserted += 1
+                if inserted >= len(df):
+                    more_button.config(state=tk.DISABLED)
+            
+            more_button = tk.Button(window, text="Load more", command=load_more)
+            more_button.pack(side=tk.BOTTOM, pady=5)
+            load_more()
         else:
             messagebox.showinfo("Info", "No data available for the selected filter.")
 
-# Example usage
-data_manager = DataManager('tabdb.csv', 'playdb.csv', 'requestdb.csv')
-query_manager = QueryManager(data_manager)
-plot_manager = PlotManager(data_manager)
-user_interface = UserInterface(data_manager, query_manager, plot_manager)
+def main():
+    """
+    Create the managers for the default CSV files and start the user interface.
+    """
+    data_manager = DataManager('tabdb.csv', 'playdb.csv', 'requestdb.csv')
+    query_manager = QueryManager(data_manager)
+    plot_manager = PlotManager(data_manager)
+    user_interface = UserInterface(data_manager, query_manager, plot_manager)
+    user_interface.run()
+
+if __name__ == "__main__":
+    main()